@@ -9,8 +9,12 @@ from typing import (
 T = TypeVar("T")
 KEY_TYPE = Union[str, int, tuple[Any, ...]]
 
+# Sentinel distinguishing a cache miss from a cached falsy value.
+_MISSING = object()
+
 class LRUCache(Generic[T]):
-    """A simple LRU key-value cache implementation."""
+    """A simple LRU key-value cache implementation. Relies on dict insertion
+    order, with the most recently used entry being last."""
     
     __slots__ = (
         "_cache",
@@ -24,22 +28,6 @@ class LRUCache(Generic[T]):
     def __len__(self) -> int:
         return len(self._cache)
     
-    def __add_to_front(self, key: KEY_TYPE, value: T) -> None:
-        """Adds a value of `value` to the front of the cache with the key `key`."""
-        
-        self._cache = {
-            key: value
-        } | self._cache
-    
-    def __clear_to_capacity(self) -> None:
-        """Removes items from the end of the cache until it is at capacity."""
-        
-        cache_keys = tuple(self._cache.keys())
-        rem_keys = cache_keys[self.capacity:]
-        
-        for key in rem_keys:
-            self.remove(key)
-        
     def remove(self, key: KEY_TYPE) -> None:
         """Remove a value from the cache with `key` key. Has no effect if value
         did not exist."""
@@ -52,19 +40,21 @@ class LRUCache(Generic[T]):
     def get(self, key: KEY_TYPE) -> Optional[T]:
         """Attempts to fetch a value from the cache with the key `key`."""
         
-        res = self._cache.get(key)
-        
-        # Move to front if found
-        if res is not None:
-            self.remove(key)
-            self.__add_to_front(key, res)
+        val = self._cache.pop(key, _MISSING)
+        if val is _MISSING:
+            return None
         
-        return res
+        # Re-insert to move it to the most recently used end.
+        self._cache[key] = val
+        return val
 
     def insert(self, key: KEY_TYPE, value: T) -> None:
-        """Inserts a value with key `key` to the front of the LRU cache."""
+        """Inserts a value with key `key` as the most recently used entry of
+        the LRU cache."""
         
-        self.__add_to_front(key, value)
+        self._cache.pop(key, None)
+        self._cache[key] = value
         
+        # Evict the least recently used entry (first in insertion order).
         if len(self) > self.capacity:
-            self.__clear_to_capacity()
+            self._cache.pop(next(iter(self._cache)))
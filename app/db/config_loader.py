@@ -1,8 +1,16 @@
 from dataclasses import dataclass, field
-from json import dump, load
+from json import dumps
 from typing import Union
 import os
 
+# orjson is considerably faster at reading, however fall back to the standard
+# library if it is not available. Writing always uses the standard library, as
+# the file is meant to be edited by hand with 4 space indentation.
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 from logger import debug
 from logger import info
 
@@ -20,8 +28,8 @@ class JsonFile:
         """Reloads the file fully into memory."""
 
         if os.path.exists(self.file_name):
-            with open(self.file_name, "r") as f:
-                self.file = load(f)
+            with open(self.file_name, "rb") as f:
+                self.file = loads(f.read())
 
     def get_file(self) -> dict:
         """Returns the loaded JSON file as a dict.
@@ -36,11 +44,9 @@ class JsonFile:
             new_content (dict, list): The new content that should be placed
                 within the file.
         """
-        
-        print(new_content)
 
-        with open(self.file_name, "w") as f:
-            dump(new_content, f, indent=4)
+        with open(self.file_name, "wb") as f:
+            f.write(dumps(new_content, indent= 4).encode())
 
         self.file = new_content
 
@@ -80,6 +86,8 @@ class ConfigLoader:
             setattr(cls, var_name, key_val)
 
         if cls.updated:
+            # Write all of the new keys to the file at once.
+            cls.json.write_file(cls.json.file)
             cls.on_finish_update(cls, cls.updated_keys)
 
     def on_finish_update(self, keys_updated: list):
@@ -111,16 +119,14 @@ class ConfigLoader:
             self.json.file = {}
 
         # Check if the key is present. If not, set it.
-        if key not in tuple(self.json.file):
-            # Set it so we can check if the key was modified.
+        if key not in self.json.file:
+            # Set it so we can check if the key was modified. The file is
+            # written once all keys have been read.
             self.updated = True
             self.updated_keys.append(key)
             # Set the value in dict.
             self.json.file[key] = default
 
-            # Write it to the file.
-            self.json.write_file(self.json.file)
-
             # Return default
             return default
 
@@ -1,44 +1,306 @@
 from typing import Any, Iterable, Optional
+import asyncio
 import aiomysql
 
+QUERY = tuple[str, tuple[Any, ...]]
+
+class MultiStatementError(Exception):
+    """Raised when a multi-statement query fails part way through. Holds the
+    result sets of the statements that completed before the failure."""
+
+    def __init__(self, results: list[tuple[dict[str, Any]]]) -> None:
+        super().__init__(
+            f"Multi-statement query failed after {len(results)} statements."
+        )
+        self.results = results
+
 class Connection:
     """A thin wrapper around an aiomysql connection offering a nicer API (imo)."""
 
     __slots__ = (
         "_conn",
+        "_cur",
+        "_dict_cur",
     )
 
     def __init__(self, conn: aiomysql.Connection) -> None:
         """Creates an instance of `Connection` from an aiomysql connection."""
 
         self._conn = conn
+        # Cursors reused by all queries on the connection, created on first use.
+        self._cur: Optional[aiomysql.Cursor] = None
+        self._dict_cur: Optional[aiomysql.DictCursor] = None
+    
+    async def __cursor(self) -> aiomysql.Cursor:
+        """Returns the reused cursor for queries not requiring dict rows."""
+
+        if self._cur is None:
+            self._cur = await self._conn.cursor()
+        
+        return self._cur
+    
+    async def __dict_cursor(self) -> aiomysql.DictCursor:
+        """Returns the reused cursor for queries returning dict rows."""
+
+        if self._dict_cur is None:
+            self._dict_cur = await self._conn.cursor(aiomysql.DictCursor)
+        
+        return self._dict_cur
+    
+    async def close(self) -> None:
+        """Closes the cursors of the connection. Must be called before the
+        underlying connection is released."""
+
+        if self._cur is not None:
+            await self._cur.close()
+            self._cur = None
+        
+        if self._dict_cur is not None:
+            await self._dict_cur.close()
+            self._dict_cur = None
+    
+    async def __aenter__(self) -> "Connection":
+        return self
+    
+    async def __aexit__(self, *_) -> None:
+        await self.close()
     
     async def execute(self, query: str, args: Iterable[Any] = ()) -> Optional[int]:
-        """Executes `query` on a new cursor, returning lastrowid."""
+        """Executes `query` on a reused cursor, returning lastrowid."""
+
+        cur = await self.__cursor()
+        await cur.execute(query, args)
+        return cur.lastrowid
+    
+    async def executemany(self, query: str, seq_of_args: Iterable[Iterable[Any]]) -> int:
+        """Executes `query` once for each set of arguments in `seq_of_args`,
+        batching inserts into a single round trip. Returns the affected row
+        count."""
 
-        async with self._conn.cursor() as cur:
-            await cur.execute(query, args)
-            return cur.lastrowid
+        cur = await self.__cursor()
+        await cur.executemany(query, seq_of_args)
+        return cur.rowcount
     
     async def fetchall(self, query: str, args: Iterable[Any] = ()) -> tuple[dict[str, Any]]:
-        """Executes `query` on a new cursor, returning all results."""
+        """Executes `query` on a reused cursor, returning all results."""
 
-        async with self._conn.cursor(aiomysql.DictCursor) as cur:
-            await cur.execute(query, args)
-            return await cur.fetchall()
+        cur = await self.__dict_cursor()
+        await cur.execute(query, args)
+        return await cur.fetchall()
     
     async def fetchone(self, query: str, args: Iterable[Any] = ()) -> Optional[dict[str, Any]]:
-        """Executes `query` on a new cursor, returning the first result."""
+        """Executes `query` on a reused cursor, returning the first result."""
 
-        async with self._conn.cursor(aiomysql.DictCursor) as cur:
-            await cur.execute(query, args)
-            return await cur.fetchone()
+        cur = await self.__dict_cursor()
+        await cur.execute(query, args)
+        return await cur.fetchone()
     
     async def fetchcol(self, query: str, args: Iterable[Any] = ()) -> Optional[Any]:
         """Fetches the first column of the first result."""
 
-        async with self._conn.cursor() as cur:
-            await cur.execute(query, args)
-            res = await cur.fetchone()
+        cur = await self.__cursor()
+        await cur.execute(query, args)
+        res = await cur.fetchone()
+        
+        return res[0] if res else None
+    
+    async def fetchall_multi(self, queries: Iterable[QUERY]) -> list[tuple[dict[str, Any]]]:
+        """Executes all `queries` (pairs of query and args) as a single
+        multi-statement round trip, returning the results of each in order.
+        
+        Note:
+            Requires the connection to be created with the `MULTI_STATEMENTS`
+            client flag. Raises `MultiStatementError` holding the results read
+            so far if a statement fails, as MySQL stops executing at it.
+        """
+
+        cur = await self.__dict_cursor()
+        results = []
+
+        try:
+            # Trailing semicolons would otherwise produce empty statements.
+            await cur.execute(";".join(
+                cur.mogrify(query.rstrip("; \t\r\n"), args) for query, args in queries
+            ))
+
+            results.append(await cur.fetchall())
+            while await cur.nextset():
+                results.append(await cur.fetchall())
+        except Exception as e:
+            raise MultiStatementError(results) from e
+        
+        return results
+
+class BatchingConnection:
+    """A wrapper around `Connection` coalescing bursts of small independent
+    `fetchall` calls into multi-statement queries, sending at most one
+    batch over the network at a time.
+    
+    Note:
+        The wrapped connection must be created with the `MULTI_STATEMENTS`
+        client flag, which is limited to a dedicated pool rather than enabled
+        for the shared one. Use `app.state.database.batching_connection` to
+        acquire one.
+
+        The wrapped `Connection` must not be used directly while the batcher
+        is in use, as both would run queries on its shared cached cursor.
+    """
+
+    __slots__ = (
+        "_conn",
+        "_pending",
+        "_drain_task",
+        "batch_interval",
+        "max_batch",
+    )
+
+    def __init__(
+        self,
+        conn: Connection,
+        batch_interval: float = 0.0005,
+        max_batch: int = 64,
+    ) -> None:
+        """Creates an instance of `BatchingConnection` around `conn`. Queries
+        are buffered for up to `batch_interval` seconds or until `max_batch`
+        are pending."""
+
+        self._conn = conn
+        self._pending: list[tuple[asyncio.Future, str, tuple[Any, ...]]] = []
+        self._drain_task: Optional[asyncio.Task] = None
+
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+    
+    async def close(self) -> None:
+        """Waits for any queued queries to finish, then closes the cursors of
+        the wrapped connection."""
+
+        if self._drain_task is not None:
+            # Any exceptions have already been passed on to the callers.
+            await asyncio.gather(self._drain_task, return_exceptions= True)
+        
+        await self._conn.close()
+    
+    async def fetchall(self, query: str, args: Iterable[Any] = ()) -> tuple[dict[str, Any]]:
+        """Queues `query` to be executed in the next batch, returning all
+        results once it has been executed.
+        
+        Note:
+            Only read-only `SELECT` queries are accepted, as queries of a
+            failed batch may be executed again. Raises `ValueError` if `query`
+            is not a `SELECT` or consists of multiple statements, as their
+            extra result sets could not be matched to the callers.
+        """
+
+        if query.lstrip()[:6].upper() != "SELECT":
+            raise ValueError("Batched queries must be read-only SELECTs!")
+
+        if ";" in query.rstrip("; \t\r\n"):
+            raise ValueError("Batched queries must be a single statement!")
+
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((fut, query, tuple(args)))
+
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self.__drain())
+        
+        return await fut
+    
+    async def __drain(self) -> None:
+        """Executes the pending queries in batches until none are left."""
+
+        batch = []
+
+        try:
+            while self._pending:
+                # Give other callers a chance to join the batch.
+                if len(self._pending) < self.max_batch:
+                    await asyncio.sleep(self.batch_interval)
+                
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                await self.__execute_batch(batch)
+        except BaseException as e:
+            # Make sure no caller is left waiting forever, such as when the
+            # task is cancelled on shutdown.
+            unresolved = batch + self._pending
+            self._pending.clear()
+
+            for fut, _, _ in unresolved:
+                if fut.done():
+                    continue
+
+                if isinstance(e, asyncio.CancelledError):
+                    fut.cancel()
+                else:
+                    fut.set_exception(e)
+            raise
+        finally:
+            self._drain_task = None
+    
+    async def __execute_batch(self, batch: list[tuple[asyncio.Future, str, tuple[Any, ...]]]) -> None:
+        """Executes `batch` in a single round trip, resolving the future of
+        each query with its results."""
+
+        try:
+            results = await self._conn.fetchall_multi(
+                (query, args) for _, query, args in batch
+            )
+        except MultiStatementError as e:
+            # MySQL stops at the failing statement, so only it and the ones
+            # after it are executed again, each on its own for every caller
+            # to get its own result or error.
+            completed = len(e.results)
+            if completed > len(batch):
+                self.__fail_batch(batch, e)
+                return
             
-            return res[0] if res else None
+            self.__resolve_batch(batch[:completed], e.results)
+            await self.__execute_each(batch[completed:])
+            return
+        
+        # Results can only be matched to callers if every query produced
+        # exactly one result set.
+        if len(results) != len(batch):
+            self.__fail_batch(batch, RuntimeError(
+                f"Batch of {len(batch)} queries returned {len(results)} result sets!"
+            ))
+            return
+        
+        self.__resolve_batch(batch, results)
+    
+    @staticmethod
+    def __resolve_batch(
+        batch: list[tuple[asyncio.Future, str, tuple[Any, ...]]],
+        results: list[tuple[dict[str, Any]]],
+    ) -> None:
+        """Resolves the future of each query in `batch` with its results."""
+
+        for (fut, _, _), res in zip(batch, results):
+            if not fut.done():
+                fut.set_result(res)
+    
+    @staticmethod
+    def __fail_batch(batch: list[tuple[asyncio.Future, str, tuple[Any, ...]]], e: BaseException) -> None:
+        """Sets `e` as the exception of every unresolved future in `batch`."""
+
+        for fut, _, _ in batch:
+            if not fut.done():
+                fut.set_exception(e)
+    
+    async def __execute_each(self, batch: list[tuple[asyncio.Future, str, tuple[Any, ...]]]) -> None:
+        """Executes every query of `batch` separately, resolving the future of
+        each with its results or exception."""
+
+        for fut, query, args in batch:
+            if fut.done():
+                continue
+
+            try:
+                res = await self._conn.fetchall(query, args)
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+            else:
+                if not fut.done():
+                    fut.set_result(res)
@@ -2,14 +2,16 @@ from typing import (
     Callable,
     Awaitable,
     Any,
-    Optional,
 )
 import asyncio
 
 CORO_FUNC = Callable[[Any], Awaitable]
 
-# TODO: Maybe look into running them all concurrently.
-async def execute_all(l: list[CORO_FUNC], args: tuple[Any]) -> None:
+async def execute_all(l: tuple[CORO_FUNC, ...], args: tuple[Any]) -> None:
+    """Concurrently executes all coroutines within `l` with `args`."""
+    await asyncio.gather(*(func(*args) for func in l))
+
+async def execute_all_sequential(l: tuple[CORO_FUNC, ...], args: tuple[Any]) -> None:
     """Sequentially executes all coroutines within `l` with `args`."""
     for func in l:
         await func(*args)
@@ -19,43 +21,53 @@ class EventManager:
     
     __slots__ = (
         "_events",
+        "_sequential",
     )
     
     def __init__(self) -> None:
         """Initialises an empty event manager."""
         
-        self._events: dict[str, list[CORO_FUNC]] = {}
-        
-    def register(self, event: str, callback: CORO_FUNC) -> None:
-        """Adds a callback to the event manager."""
-        
-        event_list = self._events.get(event)
+        # Stored as immutable tuples as they are iterated far more often than
+        # they are registered to.
+        self._events: dict[str, tuple[CORO_FUNC, ...]] = {}
+        # Events whose callbacks depend on each other's ordering.
+        self._sequential: set[str] = set()
         
-        if event_list is None:
-            self._events[event] = event_list = []
+    def register(self, event: str, callback: CORO_FUNC, sequential: bool = False) -> None:
+        """Adds a callback to the event manager. If `sequential` is set, all
+        callbacks for `event` are awaited one by one in registration order
+        rather than concurrently."""
         
-        event_list.append(callback)
+        self._events[event] = self._events.get(event, ()) + (callback,)
+
+        if sequential:
+            self._sequential.add(event)
     
-    def on(self, event: str) -> Callable:
+    def on(self, event: str, sequential: bool = False) -> Callable:
         """Decorator that ads a callback to the event manager."""
         
         def decorator(func: CORO_FUNC) -> CORO_FUNC:
-            self.register(event, func)
+            self.register(event, func, sequential)
             return func
         
         return decorator
     
-    async def emit(self, event: str, *args: Any) -> Optional[Awaitable]:
-        """Emits an event to the event manager. Executes all associated callbacks in 
-        a new task sequentially."""
+    async def emit(self, event: str, *args: Any) -> None:
+        """Emits an event to the event manager. Awaits all associated
+        callbacks, concurrently unless the event was registered as
+        sequential."""
+        
+        event_list = self._events.get(event, ())
         
-        event_list = self._events.get(event)
+        if not event_list:
+            return
         
-        if event_list is None:
+        # Skip the loop entirely for the common single callback case.
+        if len(event_list) == 1:
+            await event_list[0](*args)
             return
         
-        loop = asyncio.get_event_loop()
-        return loop.create_task(
-            execute_all(event_list, args)
-        )
-        
\ No newline at end of file
+        if event in self._sequential:
+            await execute_all_sequential(event_list, args)
+        else:
+            await execute_all(event_list, args)
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import app.state
 
 def init_routers(app: FastAPI) -> None:
@@ -15,6 +16,7 @@ def init_app() -> FastAPI:
         description= "The modern Bancho implementation for the RealistikOsu stack.",
         docs_url= None,
         openapi_url= None,
+        default_response_class= ORJSONResponse,
     )
     
     init_events(f_app)
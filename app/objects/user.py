@@ -2,6 +2,21 @@ from dataclasses import dataclass
 
 @dataclass
 class User:
+    __slots__ = (
+        "id",
+        "name",
+        "name_safe",
+        "email",
+        "password_bcrypt",
+        "ban_ts",
+        "register_ts",
+        "silence_end_ts",
+        "silence_reason",
+        "privileges",
+        "donor_expire_ts",
+        "ban_reason",
+    )
+
     id: int
     name: str
     name_safe: str
@@ -1,3 +1,4 @@
 from . import constants
 from . import writer
 from . import types
+from . import packet
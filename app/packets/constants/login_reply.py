@@ -1,13 +1,15 @@
-from enum import IntEnum
+from typing import Final
 
-class LoginReply(IntEnum):
-    """Enumeration for the login response IDs."""
+# Plain integer constants rather than an `IntEnum`, as these are only ever
+# written onto the wire.
+class LoginReply:
+    """Namespace for the login response IDs."""
 
-    FAILED = -1
-    OUTDATED_CLIENT = -2
-    BANNED = -3 # TODO: find a way to make these 2 eq.
-    BANNED_2 = -4 # They are handled by the same case statement in the client.
-    BANCHO_ERROR = -5
-    SUPPORTER_REQUIRED = -6
-    PASSWORD_RESET = -7
-    VERIFICATION_REQUIRED = -8
+    FAILED: Final[int] = -1
+    OUTDATED_CLIENT: Final[int] = -2
+    BANNED: Final[int] = -3 # TODO: find a way to make these 2 eq.
+    BANNED_2: Final[int] = -4 # They are handled by the same case statement in the client.
+    BANCHO_ERROR: Final[int] = -5
+    SUPPORTER_REQUIRED: Final[int] = -6
+    PASSWORD_RESET: Final[int] = -7
+    VERIFICATION_REQUIRED: Final[int] = -8
@@ -0,0 +1,100 @@
+# Generation of specialised serialisers for packets with a fixed field layout.
+from typing import (
+    Callable,
+    TypeVar,
+)
+from functools import cache
+import keyword
+from .constants.packet_ids import PacketID
+from .writer import BinaryWriter, TYPE_FORMAT_MAP
+from .types import *
+
+__all__ = (
+    "packet",
+)
+
+T = TypeVar("T")
+FIELDS = tuple[tuple[str, SERIALISABLE_TYPES_ANNOTATION], ...]
+SERIALISER_FUNC = Callable[[object, BinaryWriter], None]
+
+# Writers of the variable length types, which can not be merged into a struct.
+_VARIABLE_WRITERS = {
+    str: "write_str",
+}
+
+@cache
+def _compile_serialiser(fields: FIELDS) -> SERIALISER_FUNC:
+    """Generates and compiles a function writing the attributes listed in
+    `fields` into a `BinaryWriter`. Consecutive fixed size fields are merged
+    into a single `write_struct` call.
+    
+    Note:
+        Raises `ValueError` if a field name is not a valid identifier or is
+        a keyword, and `TypeError` if its type is not serialisable.
+    """
+
+    lines = []
+    fmt = ""
+    attrs = []
+
+    def flush_struct() -> None:
+        nonlocal fmt
+
+        if fmt:
+            lines.append(f"w.write_struct({fmt!r}, {', '.join(attrs)})")
+            fmt = ""
+            attrs.clear()
+
+    for name, typ in fields:
+        # Names are pasted into the generated source, so they must be checked
+        # even when running with `-O`.
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"Invalid packet field name {name!r}!")
+
+        if (fmt_char := TYPE_FORMAT_MAP.get(typ)) is not None:
+            fmt += fmt_char
+            attrs.append(f"self.{name}")
+            continue
+
+        if typ not in _VARIABLE_WRITERS:
+            raise TypeError(f"Unserialisable packet field type {typ!r}!")
+        flush_struct()
+        lines.append(f"w.{_VARIABLE_WRITERS[typ]}(self.{name})")
+
+    flush_struct()
+
+    body = "\n    ".join(lines) if lines else "pass"
+    namespace = {}
+    exec(f"def _serialise(self, w):\n    {body}\n", namespace)
+    return namespace["_serialise"]
+
+def packet(packet_id: PacketID, fields: list[tuple[str, SERIALISABLE_TYPES_ANNOTATION]]) -> Callable[[type[T]], type[T]]:
+    """Class decorator generating a serialiser for a packet with the ID
+    `packet_id`, made up of the attributes in `fields` written in order.
+    
+    Example:
+        ```
+        @packet(PacketID.SRV_NOTIFICATION, fields= [("message", str)])
+        class Notification:
+            ...
+        ```
+    
+    The decorated class gains a `serialise` method returning the full packet.
+    """
+
+    serialiser = _compile_serialiser(tuple(fields))
+
+    def decorator(cls: type[T]) -> type[T]:
+        def serialise(self) -> bytearray:
+            """Serialises the packet into a bytearray ready to be sent."""
+
+            writer = BinaryWriter()
+            serialiser(self, writer)
+            return writer.finish(packet_id)
+
+        cls.packet_id = packet_id
+        cls._serialise = serialiser
+        cls.serialise = serialise
+        return cls
+
+    return decorator
@@ -6,6 +6,17 @@ import struct
 
 T = TypeVar("T")
 
+# Precompiled struct formats. osu! uses little endian values.
+_I8 = struct.Struct("<b")
+_U16 = struct.Struct("<H")
+_I16 = struct.Struct("<h")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F32 = struct.Struct("<f")
+_HEADER = struct.Struct("<HxI")
+
 class BinaryReader:
     """A binary-deserialisation class managing a buffer of bytes. Tailored for
     usage within osu's binary formats, such as Bancho packets and replays."""
@@ -37,23 +48,22 @@ class BinaryReader:
         if self.empty:
             raise StopIteration
         
-        packet_id = self.read_u16()
-        self.skip(1) # Pad
-        length = self.read_u32()
+        packet_id, length = self.read_osu_header()
         return PacketID(packet_id), length
     
     @property
     def empty(self) -> bool:
         """Bool corresponding to whether the buffer has been fully read."""
 
-        return self._offset + 1 >= len(self._buffer)
+        return self._offset >= len(self._buffer)
     
     def read_bytes(self, amount: int) -> Union[bytearray, bytes]:
         """Reads `amount` bytes from the current offset and increments the
         offset of the reader by `amount`. Returns the buffer slice."""
 
-        buf_slice = self._buffer[self._offset:self.__incr_offset(amount)]
-        return buf_slice
+        start = self._offset
+        self._offset = end = start + amount
+        return self._buffer[start:end]
     
     def __incr_offset(self, amount: int) -> int:
         """Increments the reader offset by `amount`, returning its new value."""
@@ -66,50 +76,68 @@ class BinaryReader:
         """Reads an unsigned 8-bit integer from the buffer."""
 
         # Since the bytearray itself stores 8-bit integers, there is no
-        # further processing necessary. This can however fail if there
-        # is no more data to be read, however that means something already
-        # is very messed up.
-        return self.read_bytes(1)[0]
+        # further processing necessary. Indexing directly avoids creating
+        # a slice. This can however fail if there is no more data to be
+        # read, however that means something already is very messed up.
+        val = self._buffer[self._offset]
+        self._offset += 1
+        return val
     
     def read_i8(self) -> i8:
         """Reads a signed 8-bit integer from the buffer."""
 
-        return struct.unpack("<b", self.read_bytes(1))[0]
+        val, = _I8.unpack_from(self._buffer, self._offset)
+        self._offset += 1
+        return val
     
     def read_u16(self) -> u16:
         """Reads an unsigned 16-bit integer from the buffer."""
 
-        return struct.unpack("<H", self.read_bytes(2))[0]
+        val, = _U16.unpack_from(self._buffer, self._offset)
+        self._offset += 2
+        return val
     
     def read_i16(self) -> i16:
         """Reads a signed 16-bit integer from the buffer."""
 
-        return struct.unpack("<h", self.read_bytes(2))[0]
+        val, = _I16.unpack_from(self._buffer, self._offset)
+        self._offset += 2
+        return val
     
     def read_u32(self) -> u32:
         """Reads an unsigned 32-bit integer from the buffer."""
 
-        return struct.unpack("<I", self.read_bytes(4))[0]
+        val, = _U32.unpack_from(self._buffer, self._offset)
+        self._offset += 4
+        return val
     
     def read_i32(self) -> i32:
         """Reads a signed 32-bit integer from the buffer."""
 
-        return struct.unpack("<i", self.read_bytes(4))[0]
+        val, = _I32.unpack_from(self._buffer, self._offset)
+        self._offset += 4
+        return val
     
     def read_u64(self) -> u64:
         """Reads an unsigned 64-bit integer from the buffer."""
 
-        return struct.unpack("<Q", self.read_bytes(8))[0]
+        val, = _U64.unpack_from(self._buffer, self._offset)
+        self._offset += 8
+        return val
     
     def read_i64(self) -> i64:
         """Reads a signed 64-bit integer from the buffer."""
 
-        return struct.unpack("<q", self.read_bytes(8))[0]
+        val, = _I64.unpack_from(self._buffer, self._offset)
+        self._offset += 8
+        return val
     
     def read_f32(self) -> float:
         """Reads a 32-bit floating point integer from the buffer."""
 
-        return struct.unpack("<f", self.read_bytes(4))[0]
+        val, = _F32.unpack_from(self._buffer, self._offset)
+        self._offset += 4
+        return val
 
     # osu! specific types
     def read_osu_header(self) -> tuple[u16, u32]:
@@ -118,38 +146,49 @@ class BinaryReader:
         Note:
             Raises `AssertionError` if the `offset + 3` byte (pad byte) does
             not equal to 0. This is because that means the reader has encountered
-            a misread.
+            a misread. The check is skipped when running with `-O`.
         """
 
-        packet_id = self.read_u16()
-        assert self.read_bytes(1)[0] == 0, "Missing padding byte! Misread occured."
-        packet_length = self.read_u32()
+        assert self._buffer[self._offset + 2] == 0, "Missing padding byte! Misread occured."
+        packet_id, packet_length = _HEADER.unpack_from(self._buffer, self._offset)
+        self._offset += 7
         return packet_id, packet_length
     
     def read_uleb128(self) -> int:
         """Reads an unsigned 128-bit LEB variable length integer from the buffer."""
 
-        if self.read_bytes(1)[0] != 0x0B:
+        # Work on locals to avoid attribute lookups and slices per byte.
+        buf = self._buffer
+        offset = self._offset
+
+        if buf[offset] != 0x0B:
+            self._offset = offset + 1
             return 0
+        offset += 1
 
         val = shift = 0
         while True:
-            b = self.read_bytes(1)[0]
+            b = buf[offset]
+            offset += 1
             val |= (b & 0b01111111) << shift
             if (b & 0b10000000) == 0:
                 break
             shift += 7
+        
+        self._offset = offset
         return val
     
     def read_str(self) -> str:
         """Reads an osu-styled binary string from the buffer."""
 
         # The exists byte.
-        if self.read_bytes(1)[0] == 0:
+        if self.read_u8() == 0:
             return ""
         
         length = self.read_uleb128()
-        return self.read_bytes(length).decode()
+        start = self._offset
+        self._offset = end = start + length
+        return str(self._buffer[start:end], "utf-8")
 
     def skip(self, x: int) -> int:
         """Skips `x` bytes in the buffer.
@@ -168,6 +207,17 @@ class BinaryReader:
         """
 
         return TYPE_READER_MAP[t](self)
+    
+    def read_list(self, t: Type[T], count: int) -> list[T]:
+        """Reads `count` items of type `t` from the buffer. The reader is
+        looked up once for the entire list.
+        
+        Note:
+            Raises `KeyError` if the type is not valid.
+        """
+
+        reader = TYPE_READER_MAP[t]
+        return [reader(self) for _ in range(count)]
 
 TYPE_READER_MAP = {
     str: BinaryReader.read_str,
@@ -1,12 +1,13 @@
 # An implementation of a binary serialiser specifically tailored to be utilised
 # with osu's binary formats.
 from typing import (
+    Any,
     Union,
     TypeVar,
     Callable,
     Type,
 )
-from functools import cache
+from functools import cache, lru_cache
 from .constants.packet_ids import PacketID
 from .types import *
 import struct
@@ -18,73 +19,105 @@ __all__ = (
 
 HEADER_LEN = 7
 NULL_HEADER = bytearray(b"\x00" * HEADER_LEN)
+# The minimum amount of bytes the buffer is grown by when out of space.
+GROWTH_LEN = 64
+
+# Precompiled struct formats.
+# https://docs.python.org/3/library/struct.html#format-characters
+# osu! uses little endian values.
+_I8 = struct.Struct("<b")
+_U16 = struct.Struct("<H")
+_I16 = struct.Struct("<h")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F32 = struct.Struct("<f")
+_HEADER = struct.Struct("<HxI")
 
 class BinaryWriter:
     """A binary serialiser managing the contents of a bytearray. It by itself
     is not thread-safe."""
 
-    __slots__ = ("_buffer",)
+    __slots__ = (
+        "_buffer",
+        "_len",
+    )
 
     def __init__(self, pralloc_header: bool = True) -> None:
         # Pre-allocate the header.
         self._buffer = NULL_HEADER.copy() \
             if pralloc_header else bytearray()
+        
+        # The buffer is over-allocated, so the amount of bytes written is
+        # tracked separately.
+        self._len = len(self._buffer)
+    
+    def __reserve(self, amount: int) -> int:
+        """Advances the write cursor by `amount` bytes, growing the buffer if
+        necessary. Returns the offset the data should be written at."""
+
+        start = self._len
+        self._len = end = start + amount
+
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(end - len(self._buffer), GROWTH_LEN)))
+        
+        return start
     
-    # Using the struct module to write primitive types into the buffer.
-    # https://docs.python.org/3/library/struct.html#format-characters
-    # osu! uses little endian values.
+    # Using the precompiled structs to write primitive types into the buffer.
     def write_i8(self, num: i8) -> "BinaryWriter":
         """Writes a signed 8-bit integer to the buffer."""
 
-        self._buffer += struct.pack("<b", num)
+        _I8.pack_into(self._buffer, self.__reserve(1), num)
         return self
 
     def write_u8(self, num: u8) -> "BinaryWriter":
         """Writes an 8-bit unsigned integer into the buffer."""
 
-        self._buffer.append(num)
+        self._buffer[self.__reserve(1)] = num
         return self
     
     def write_i16(self, num: i16) -> "BinaryWriter":
         """Writes a signed 16-bit integer to the buffer."""
 
-        self._buffer += struct.pack("<h", num)
+        _I16.pack_into(self._buffer, self.__reserve(2), num)
         return self
 
     def write_u16(self, num: u16) -> "BinaryWriter":
         """Writes an 16-bit unsigned integer into the buffer."""
 
-        self._buffer += struct.pack("<H", num)
+        _U16.pack_into(self._buffer, self.__reserve(2), num)
         return self
 
     def write_i32(self, num: i32) -> "BinaryWriter":
         """Writes a signed 32-bit integer to the buffer."""
 
-        self._buffer += struct.pack("<i", num)
+        _I32.pack_into(self._buffer, self.__reserve(4), num)
         return self
 
     def write_u32(self, num: u32) -> "BinaryWriter":
         """Writes an 8-bit unsigned integer into the buffer."""
 
-        self._buffer += struct.pack("<I", num)
+        _U32.pack_into(self._buffer, self.__reserve(4), num)
         return self
 
     def write_i64(self, num: i64) -> "BinaryWriter":
         """Writes a signed 64-bit integer to the buffer."""
 
-        self._buffer += struct.pack("<q", num)
+        _I64.pack_into(self._buffer, self.__reserve(8), num)
         return self
 
     def write_u64(self, num: u64) -> "BinaryWriter":
         """Writes an 8-bit unsigned integer into the buffer."""
 
-        self._buffer += struct.pack("<Q", num)
+        _U64.pack_into(self._buffer, self.__reserve(8), num)
         return self
     
     def write_f32(self, num: float) -> "BinaryWriter":
         """Writes a 32-bit floating point integer into the buffer."""
 
-        self._buffer += struct.pack("<f", num)
+        _F32.pack_into(self._buffer, self.__reserve(4), num)
         return self
     
     # Relatively more osu!-standardised types.
@@ -98,7 +131,7 @@ class BinaryWriter:
             self.write_u8(num & 127)
             num >>= 7
             if num != 0:
-                self._buffer[-1] |= 128
+                self._buffer[self._len - 1] |= 128
         
         return self
     
@@ -125,6 +158,11 @@ class BinaryWriter:
         its length as u16."""
 
         self.write_u16(len(l))
+
+        # Fixed size types can be packed all at once.
+        if (fmt_char := TYPE_FORMAT_MAP.get(typ)) is not None:
+            return self.__write_packed_list(l, fmt_char)
+
         writer = _writer_from_type(typ)
 
         for elem in l:
@@ -135,12 +173,37 @@ class BinaryWriter:
     def write_osu_list(self, l: list[i32]) -> "BinaryWriter":
         """Writes a u16 prefixed list of i32s into the buffer."""
 
-        return self.write_list(l, i32)
+        self.write_u16(len(l))
+        return self.__write_packed_list(l, "i")
+    
+    def __write_packed_list(self, l: list, fmt_char: str) -> "BinaryWriter":
+        """Packs all elements of `l` into the buffer in a single call, using
+        the struct format character `fmt_char`."""
+
+        if l:
+            s = _list_struct(fmt_char, len(l))
+            s.pack_into(self._buffer, self.__reserve(s.size), *l)
+        
+        return self
+    
+    def write_struct(self, fmt: str, *vals: Any) -> "BinaryWriter":
+        """Writes `vals` into the buffer in a single pack using the struct
+        format `fmt` (without the byte order character, which is always
+        little endian).
+        
+        Example:
+            `writer.write_struct("iiH", user_id, mode, count)`
+        """
+
+        s = _struct_from_fmt(fmt)
+        s.pack_into(self._buffer, self.__reserve(s.size), *vals)
+        return self
     
     def write_raw(self, contents: Union[bytes, bytearray]) -> "BinaryWriter":
         """Appends raw binary bytes onto the buffer."""
 
-        self._buffer += contents
+        start = self.__reserve(len(contents))
+        self._buffer[start:self._len] = contents
         return self
     
     def finish(self, packet_id: PacketID) -> bytearray:
@@ -150,7 +213,9 @@ class BinaryWriter:
         #assert self._buffer[0:6] == NULL_HEADER, "Attempted to write into a non-empty header!"
         #self._buffer[0:1] = struct.pack("<H", packet_id.value)
         #self._buffer[3:6] = struct.pack("<I", len(self._buffer) - HEADER_LEN)
-        self._buffer[0:7] = struct.pack("<HxI", packet_id.value, len(self._buffer) - HEADER_LEN)
+        # Drop the unused over-allocated tail.
+        del self._buffer[self._len:]
+        _HEADER.pack_into(self._buffer, 0, packet_id.value, self._len - HEADER_LEN)
         return self._buffer
 
 
@@ -167,6 +232,19 @@ _READERS = {
     float: BinaryWriter.write_f32,
 }
 
+# Struct format characters of the fixed size serialisable types.
+TYPE_FORMAT_MAP = {
+    u8: "B",
+    i8: "b",
+    u16: "H",
+    i16: "h",
+    u32: "I",
+    i32: "i",
+    u64: "Q",
+    i64: "q",
+    float: "f",
+}
+
 @cache
 def _writer_from_type(typ: Type[T]) -> Callable[[BinaryWriter, T], BinaryWriter]:
     """Fetches the binary writer function corresponding to the type trying
@@ -178,4 +256,18 @@ def _writer_from_type(typ: Type[T]) -> Callable[[BinaryWriter, T], BinaryWriter]
 
     assert typ in _READERS
 
-    return _READERS[typ]
\ No newline at end of file
+    return _READERS[typ]
+
+@cache
+def _struct_from_fmt(fmt: str) -> struct.Struct:
+    """Compiles a little endian `struct.Struct` for the format `fmt`."""
+
+    return struct.Struct("<" + fmt)
+
+# Bounded, as list lengths vary far more than fixed packet layouts.
+@lru_cache(maxsize= 64)
+def _list_struct(fmt_char: str, length: int) -> struct.Struct:
+    """Compiles a little endian `struct.Struct` for `length` consecutive
+    values of the format character `fmt_char`."""
+
+    return struct.Struct(f"<{length}{fmt_char}")
@@ -7,6 +7,8 @@ class Config(ConfigLoader):
     SQL_USER: str = "root"
     SQL_DB: str = "rosu"
     SQL_PASS: str = "db password"
+    SQL_POOL_MIN: int = 10
+    SQL_POOL_MAX: int = 50
     SRV_URL: str = "https://ussr.pl"
     SRV_NAME: str = "RealistikOsu"
     
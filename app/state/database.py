@@ -1,19 +1,74 @@
-from app.db.mysql import Connection
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from app.db.mysql import BatchingConnection, Connection
 from .config import config
+from pymysql.constants import CLIENT
+import asyncio
 import aiomysql
 
+# The max connections of the dedicated pool used by `BatchingConnection`.
+BATCH_POOL_MAX = 4
+
 sql_pool: aiomysql.Pool
+# Created on first use of `batching_connection`, as it is the only user of
+# multi-statement queries.
+_batch_pool_task: Optional[asyncio.Future] = None
 
-async def create_mysql_pool() -> None:
-    """Establishes a connection to the MySQL database, creating a connection pool."""
+async def _create_pool(**kwargs: Any) -> aiomysql.Pool:
+    """Creates a connection pool to the configured MySQL database, passing
+    `kwargs` on to `aiomysql.create_pool`."""
 
-    global sql_pool
-    
-    sql_pool = await aiomysql.create_pool(
-        pool_recycle= False,
+    return await aiomysql.create_pool(
+        # Reap connections the server may have already closed.
+        pool_recycle= 3600,
+        autocommit= True,
+        charset= "utf8mb4",
         host= config.SQL_HOST,
         port= config.SQL_PORT,
         user= config.SQL_USER,
         db= config.SQL_DB,
         password= config.SQL_PASS,
+        **kwargs,
+    )
+
+async def create_mysql_pool() -> None:
+    """Establishes a connection to the MySQL database, creating a connection pool."""
+
+    global sql_pool
+    
+    sql_pool = await _create_pool(
+        minsize= config.SQL_POOL_MIN,
+        maxsize= config.SQL_POOL_MAX,
     )
+
+@asynccontextmanager
+async def batching_connection() -> AsyncIterator[BatchingConnection]:
+    """Acquires a connection from a dedicated pool with multi-statement
+    queries enabled, wrapped in a `BatchingConnection`. The pool is kept
+    separate from `sql_pool` so stacked queries can not run on ordinary
+    connections."""
+
+    global _batch_pool_task
+
+    if _batch_pool_task is None:
+        _batch_pool_task = asyncio.ensure_future(_create_pool(
+            minsize= 1,
+            maxsize= BATCH_POOL_MAX,
+            client_flag= CLIENT.MULTI_STATEMENTS,
+        ))
+    
+    try:
+        pool = await _batch_pool_task
+    except Exception:
+        # Allow the creation to be retried.
+        _batch_pool_task = None
+        raise
+    
+    conn = await pool.acquire()
+    batcher = BatchingConnection(Connection(conn))
+
+    try:
+        yield batcher
+    finally:
+        await batcher.close()
+        await pool.release(conn)
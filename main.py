@@ -1,13 +1,12 @@
 import uvicorn
-import uvloop
-
-uvloop.install()
 
 def main() -> int:
     uvicorn.run(
         "app.init_api:fastapi_app",
         server_header= False,
         date_header= False,
+        loop= "uvloop",
+        http= "httptools",
     )
     
     return 0